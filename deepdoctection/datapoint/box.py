@@ -21,13 +21,13 @@ Implementation of BoundingBox class and related methods
 
 from dataclasses import dataclass
 from math import ceil, floor
-from typing import List, Optional, Sequence, no_type_check
+from typing import Iterable, List, Optional, Sequence, no_type_check
 
 import numpy as np
 import numpy.typing as npt
 from numpy import float32
 
-from ..utils.detection_types import ImageType
+from ..utils.detection_types import ImageType, JsonDict
 from ..utils.error import BoundingBoxError
 from ..utils.file_utils import cocotools_available
 from ..utils.logger import LoggingRecord, logger
@@ -361,6 +361,18 @@ class BoundingBox:
         """
         return cls(**kwargs)
 
+    @classmethod
+    @no_type_check
+    def from_dicts(cls, box_dicts: Iterable[JsonDict]) -> List["BoundingBox"]:
+        """
+        Create `BoundingBox` instances from an iterable of dicts. Prefer this over calling `from_dict` in a loop, as the
+        dicts are passed to the constructor directly without being repacked as keyword arguments of `from_dict`.
+
+        :param box_dicts: dicts with `BoundingBox` attributes
+        :return: Initialized BoundingBoxes in the order of `box_dicts`
+        """
+        return [cls(**box_dict) for box_dict in box_dicts]
+
 
 def intersection_box(
     box_1: BoundingBox, box_2: BoundingBox, width: Optional[float] = None, height: Optional[float] = None
@@ -22,7 +22,7 @@ import json
 from dataclasses import dataclass, field
 from os import environ
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Union, no_type_check
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Union, no_type_check
 
 import numpy as np
 from numpy import uint8
@@ -321,7 +321,9 @@ class Image:
 
     def get_annotation(
         self,
-        category_names: Optional[Union[str, ObjectTypes, Sequence[Union[str, ObjectTypes]]]] = None,
+        category_names: Optional[
+            Union[str, ObjectTypes, Sequence[Union[str, ObjectTypes]], FrozenSet[ObjectTypes]]
+        ] = None,
         annotation_ids: Optional[Union[str, Sequence[str]]] = None,
         service_id: Optional[Union[str, Sequence[str]]] = None,
         model_id: Optional[Union[str, Sequence[str]]] = None,
@@ -335,7 +337,7 @@ class Image:
         returned. If more than one condition is provided, only annotations will be returned that satisfy all conditions.
         If no condition is provided, it will return all active annotations.
 
-        :param category_names: A single name or list of names
+        :param category_names: A single name, a list of names or a frozenset of `ObjectTypes`
         :param annotation_ids: A single id or list of ids
         :param service_id: A single service name or list of service names
         :param model_id: A single model name or list of model names
@@ -345,14 +347,16 @@ class Image:
         :return: A (possibly empty) list of Annotations
         """
 
-        if category_names is not None:
+        if category_names is not None and not isinstance(category_names, frozenset):
             category_names = (
-                [get_type(cat_name) for cat_name in category_names]
+                {get_type(cat_name) for cat_name in category_names}
                 if isinstance(category_names, (list, set))
-                else [get_type(category_names)]  # type:ignore
+                else {get_type(category_names)}  # type:ignore
             )
 
-        ann_ids = [annotation_ids] if isinstance(annotation_ids, str) else annotation_ids
+        ann_ids = {annotation_ids} if isinstance(annotation_ids, str) else annotation_ids
+        if ann_ids is not None:
+            ann_ids = set(ann_ids)
         service_id = [service_id] if isinstance(service_id, str) else service_id
         model_id = [model_id] if isinstance(model_id, str) else model_id
         session_id = [session_ids] if isinstance(session_ids, str) else session_ids
@@ -381,7 +385,9 @@ class Image:
 
     def get_annotation_iter(
         self,
-        category_names: Optional[Union[str, ObjectTypes, Sequence[Union[str, ObjectTypes]]]] = None,
+        category_names: Optional[
+            Union[str, ObjectTypes, Sequence[Union[str, ObjectTypes]], FrozenSet[ObjectTypes]]
+        ] = None,
         annotation_ids: Optional[Union[str, Sequence[str]]] = None,
         service_id: Optional[Union[str, Sequence[str]]] = None,
         model_id: Optional[Union[str, Sequence[str]]] = None,
@@ -391,7 +397,7 @@ class Image:
         """
         Get annotation as an iterator. Same as `get_annotation` but returns an iterator instead of a list.
 
-        :param category_names: A single name or list of names
+        :param category_names: A single name, a list of names or a frozenset of `ObjectTypes`
         :param annotation_ids: A single id or list of ids
         :param service_id: A single service name or list of service names
         :param model_id: A single model name or list of model names
@@ -560,8 +566,9 @@ class Image:
             image.image = _image
         if box_kwargs := kwargs.get("_bbox"):
             image._bbox = BoundingBox.from_dict(**box_kwargs)
-        for image_id, box_dict in kwargs.get("embeddings").items():
-            image.set_embedding(image_id, BoundingBox.from_dict(**box_dict))
+        embeddings = kwargs.get("embeddings")
+        for image_id, bounding_box in zip(embeddings, BoundingBox.from_dicts(embeddings.values())):
+            image.set_embedding(image_id, bounding_box)
         for ann_dict in kwargs.get("annotations"):
             image_ann = ImageAnnotation.from_dict(**ann_dict)
             if "image" in ann_dict:
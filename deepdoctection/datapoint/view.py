@@ -21,9 +21,27 @@ simplify consumption
 """
 
 from copy import copy
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Type, Union, no_type_check
+from dataclasses import fields
+from functools import cached_property
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    no_type_check,
+)
 
 import numpy as np
+import numpy.typing as npt
 
 from ..utils.detection_types import ImageType, JsonDict, Pathlike
 from ..utils.error import AnnotationError, ImageError
@@ -36,16 +54,92 @@ from ..utils.settings import (
     Relationships,
     TableType,
     TokenClasses,
+    TypeOrStr,
     WordType,
     get_type,
 )
 from ..utils.viz import draw_boxes, interactive_imshow, viz_handler
-from .annotation import ContainerAnnotation, ImageAnnotation, SummaryAnnotation, ann_from_dict
+from .annotation import CategoryAnnotation, ContainerAnnotation, ImageAnnotation, SummaryAnnotation, ann_from_dict
 from .box import BoundingBox, crop_box_from_image
 from .image import Image
 
+_IMAGE_ANNOTATION_FIELDS = frozenset(field.name for field in fields(ImageAnnotation))
+
+_RawBox = Tuple[float, float, float, float, bool]
+
+_CELL_CATEGORIES = frozenset(
+    (
+        LayoutType.cell,
+        CellType.header,
+        CellType.body,
+        CellType.projected_row_header,
+        CellType.spanning,
+        CellType.row_header,
+        CellType.column_header,
+    )
+)
+_VIZ_CELL_CATEGORIES = frozenset(
+    (
+        LayoutType.cell,
+        CellType.projected_row_header,
+        CellType.spanning,
+        CellType.row_header,
+        CellType.column_header,
+    )
+)
+
+
+def _raw_box(bounding_box: BoundingBox) -> _RawBox:
+    """
+    :param bounding_box: A bounding box
+    :return: The coordinates `(ulx, uly, lrx, lry, absolute_coords)` of the bounding box
+    """
+    return bounding_box.ulx, bounding_box.uly, bounding_box.lrx, bounding_box.lry, bounding_box.absolute_coords
+
+
+def _resolve_sub_category(key: ObjectTypes, sub_cat: CategoryAnnotation) -> Any:
+    """
+    Resolve the value of a sub category. A sub category resolves to its `category_name`, if the key is not equal to the
+    `category_name`, to its `value` if it is a `ContainerAnnotation` and to its `category_id` otherwise.
+
+    :param key: The key of the sub category
+    :param sub_cat: The sub category annotation
+    :return: The resolved value
+    """
+    if key != sub_cat.category_name:
+        return sub_cat.category_name
+    if isinstance(sub_cat, ContainerAnnotation):
+        return sub_cat.value
+    return int(sub_cat.category_id)
+
+
+def _resolve_sub_categories(annotation: CategoryAnnotation) -> Dict[str, Any]:
+    """
+    Resolve the values of all sub categories of an annotation with `_resolve_sub_category`.
+
+    :param annotation: Annotation with sub categories
+    :return: A dict with sub category keys as strings and resolved values
+    """
+    return {key.value: _resolve_sub_category(key, sub_cat) for key, sub_cat in annotation.sub_categories.items()}
+
 
-class ImageAnnotationBaseView(ImageAnnotation):
+class _MemoizedAttributes:
+    """
+    Base class for views that memoize values in their instance `__dict__`. The keys of all memoized values are listed
+    in `_cached_attributes`.
+    """
+
+    _cached_attributes: Tuple[str, ...] = ()
+
+    def _invalidate_cache(self) -> None:
+        """
+        Remove all memoized values listed in `_cached_attributes`. They will be re-computed on the next access.
+        """
+        for attribute in self._cached_attributes:
+            self.__dict__.pop(attribute, None)
+
+
+class ImageAnnotationBaseView(_MemoizedAttributes, ImageAnnotation):
     """
     Consumption class for having easier access to categories added to an ImageAnnotation.
 
@@ -65,14 +159,21 @@ class ImageAnnotationBaseView(ImageAnnotation):
     """
 
     base_page: "Page"
+    _cached_attributes: Tuple[str, ...] = ("_sub_cat_view",)
 
     @property
     def bbox(self) -> List[float]:
         """
         Get the bounding box as list and in absolute coordinates of the base page.
+
+        The box is read from the absolute box table of the base page as long as the coordinates of the `BoundingBox`
+        are still the ones the table has been built from. Otherwise, the bounding box is transformed directly.
         """
 
         bounding_box = self.get_bounding_box(self.base_page.image_id)
+        abs_box = self.base_page._lookup_abs_bbox(self.annotation_id, bounding_box)  # pylint: disable=W0212
+        if abs_box is not None:
+            return abs_box.tolist()
 
         if not bounding_box.absolute_coords:
             bounding_box = bounding_box.transform(self.base_page.width, self.base_page.height, absolute_coords=True)
@@ -112,27 +213,26 @@ class ImageAnnotationBaseView(ImageAnnotation):
           `category_id` will be returned.
         - If nothing works, look at `self.image.summary` if the item exist. Follow the same logic as for ordinary sub
           categories.
+
+        Values of sub categories are resolved once and stored in `_sub_cat_view`, so that subsequent calls only require
+        a dict lookup. Summary sub categories are resolved on every call, as `self.image` and its summary can change
+        without notice to the view.
+
         :param item: attribute name
         :return: value according to the logic described above
         """
+        sub_cat_view = self.__dict__.get("_sub_cat_view")
+        if sub_cat_view is None:
+            sub_cat_view = self.__dict__["_sub_cat_view"] = _resolve_sub_categories(self)
+        if item in sub_cat_view:
+            return sub_cat_view[item]
         if item not in self.get_attribute_names():
             raise AnnotationError(f"Attribute {item} is not supported for {type(self)}")
-        if item in self.sub_categories:
-            sub_cat = self.get_sub_category(get_type(item))
-            if item != sub_cat.category_name:
-                return sub_cat.category_name
-            if isinstance(sub_cat, ContainerAnnotation):
-                return sub_cat.value
-            return int(sub_cat.category_id)
         if self.image is not None:
             if self.image.summary is not None:
                 if item in self.image.summary.sub_categories:
-                    sub_cat = self.get_summary(get_type(item))
-                    if item != sub_cat.category_name:
-                        return sub_cat.category_name
-                    if isinstance(sub_cat, ContainerAnnotation):
-                        return sub_cat.value
-                    return int(sub_cat.category_id)
+                    key = get_type(item)
+                    return _resolve_sub_category(key, self.get_summary(key))
         return None
 
     def get_attribute_names(self) -> Set[str]:
@@ -147,6 +247,37 @@ class ImageAnnotationBaseView(ImageAnnotation):
                 attribute_names = attribute_names.union({cat.value for cat in self.image.summary.sub_categories.keys()})
         return attribute_names
 
+    def _notify_change(self) -> None:
+        """
+        Reset the memoized values of this view and increment the cache revision of the base page, so that views
+        memoizing values derived from this view, e.g. `Layout.text`, re-compute them as well.
+        """
+        self._invalidate_cache()
+        if (base_page := self.__dict__.get("base_page")) is not None:
+            base_page._increment_cache_revision()  # pylint: disable=W0212
+
+    def deactivate(self) -> None:
+        super().deactivate()
+        self._notify_change()
+
+    def dump_sub_category(
+        self, sub_category_name: TypeOrStr, annotation: CategoryAnnotation, *container_id_context: Optional[str]
+    ) -> None:
+        super().dump_sub_category(sub_category_name, annotation, *container_id_context)
+        self._notify_change()
+
+    def remove_sub_category(self, key: ObjectTypes) -> None:
+        super().remove_sub_category(key)
+        self._notify_change()
+
+    def dump_relationship(self, key: TypeOrStr, annotation_id: str) -> None:
+        super().dump_relationship(key, annotation_id)
+        self._notify_change()
+
+    def remove_relationship(self, key: ObjectTypes, annotation_ids: Optional[Union[List[str], str]] = None) -> None:
+        super().remove_relationship(key, annotation_ids)
+        self._notify_change()
+
     @classmethod
     def from_dict(cls, **kwargs: JsonDict) -> "ImageAnnotationBaseView":
         """
@@ -158,6 +289,31 @@ class ImageAnnotationBaseView(ImageAnnotation):
             image_ann.bounding_box = BoundingBox.from_dict(**box_kwargs)
         return image_ann
 
+    @classmethod
+    def from_annotation(cls, annotation: ImageAnnotation) -> "ImageAnnotationBaseView":
+        """
+        Create a view from an `ImageAnnotation` by copying its attributes. Other than `from_dict` there is no
+        serialization round trip and `__init__` will not be called, as the annotation has already been validated.
+
+        The containers of sub categories and relationships as well as the bounding box are copied, so that dumping into
+        the view or modifying its box does not change the input annotation. Sub category annotations and the image are
+        shared with the input annotation.
+
+        :param annotation: The annotation to create a view from
+        :return: A view with the attributes of `annotation`
+        """
+        # The instance dict is assembled in one go and assigned as a whole. Fields with a class level default that
+        # have never been set on the annotation (e.g. `image`) are not in `annotation.__dict__` and fall back to the
+        # default as well.
+        view_dict = {key: value for key, value in annotation.__dict__.items() if key in _IMAGE_ANNOTATION_FIELDS}
+        view_dict["sub_categories"] = annotation.sub_categories.copy()
+        view_dict["relationships"] = {key: ann_ids.copy() for key, ann_ids in annotation.relationships.items()}
+        if (bounding_box := view_dict.get("bounding_box")) is not None:
+            view_dict["bounding_box"] = copy(bounding_box)
+        view = object.__new__(cls)
+        view.__dict__ = view_dict
+        return view
+
 
 class Word(ImageAnnotationBaseView):
     """
@@ -175,9 +331,31 @@ class Layout(ImageAnnotationBaseView):
 
     text_container: Pass the `LayoutObject` that is supposed to be used for `words`. It is possible that the
                     text_container is equal to `self.category_name`, in which case `words` returns `self`.
+
+    `words` and `text` are computed once and memoized. Dumping or removing sub categories or relationships of any
+    view of the base page, deactivating a view and dumping or removing annotations of the base page resets the
+    memoized values. Direct assignments to attributes or sub category annotations are not tracked.
     """
 
     text_container: Optional[ObjectTypes] = None
+    _cached_attributes: Tuple[str, ...] = ("_sub_cat_view", "_words", "_text")
+
+    def _get_memoized(self, attribute: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the memoized value of `attribute` or compute and memoize it. All memoized values are reset, if the cache
+        revision of the base page has changed since they have been computed.
+
+        :param attribute: The key of the memoized value in the instance `__dict__`
+        :param compute: Function that computes the value
+        :return: The memoized value
+        """
+        cache_revision = self.base_page._get_cache_revision()  # pylint: disable=W0212
+        if self.__dict__.get("_cache_revision") != cache_revision:
+            self._invalidate_cache()
+            self.__dict__["_cache_revision"] = cache_revision
+        if attribute not in self.__dict__:
+            self.__dict__[attribute] = compute()
+        return self.__dict__[attribute]
 
     @property
     def words(self) -> List[ImageAnnotationBaseView]:
@@ -185,6 +363,9 @@ class Layout(ImageAnnotationBaseView):
         Get a list of `ImageAnnotationBaseView` objects with `LayoutType` defined by `text_container`.
         It will only select those among all annotations that have an entry in `Relationships.child` .
         """
+        return self._get_memoized("_words", self._collect_words)
+
+    def _collect_words(self) -> List[ImageAnnotationBaseView]:
         if self.category_name != self.text_container:
             text_ids = self.get_relationship(Relationships.child)
             return self.base_page.get_annotation(annotation_ids=text_ids, category_names=self.text_container)
@@ -195,14 +376,18 @@ class Layout(ImageAnnotationBaseView):
         """
         Text captured within the instance respecting the reading order of each word.
         """
+        return self._get_memoized("_text", self._collect_text)
+
+    def _collect_text(self) -> str:
         words = self.get_ordered_words()
         return " ".join([word.characters for word in words])  # type: ignore
 
     def get_ordered_words(self) -> List[ImageAnnotationBaseView]:
         """Returns a list of words order by reading order. Words with no reading order will not be returned"""
-        words_with_reading_order = [word for word in self.words if word.reading_order is not None]
-        words_with_reading_order.sort(key=lambda x: x.reading_order)  # type: ignore
-        return words_with_reading_order
+        orders_and_words = [(word.reading_order, word) for word in self.words]
+        orders_and_words = [order_and_word for order_and_word in orders_and_words if order_and_word[0] is not None]
+        orders_and_words.sort(key=itemgetter(0))
+        return [word for _, word in orders_and_words]
 
     @property
     def text_(self) -> JsonDict:
@@ -267,18 +452,7 @@ class Table(Layout):
         A list of a table cells.
         """
         all_relation_ids = self.get_relationship(Relationships.child)
-        cell_anns = self.base_page.get_annotation(
-            annotation_ids=all_relation_ids,
-            category_names=[
-                LayoutType.cell,
-                CellType.header,
-                CellType.body,
-                CellType.projected_row_header,
-                CellType.spanning,
-                CellType.row_header,
-                CellType.column_header,
-            ],
-        )
+        cell_anns = self.base_page.get_annotation(annotation_ids=all_relation_ids, category_names=_CELL_CATEGORIES)
         return cell_anns
 
     @property
@@ -287,7 +461,7 @@ class Table(Layout):
         A list of a table rows.
         """
         all_relation_ids = self.get_relationship(Relationships.child)
-        row_anns = self.base_page.get_annotation(annotation_ids=all_relation_ids, category_names=[LayoutType.row])
+        row_anns = self.base_page.get_annotation(annotation_ids=all_relation_ids, category_names=LayoutType.row)
         return row_anns
 
     @property
@@ -296,7 +470,7 @@ class Table(Layout):
         A list of a table columns.
         """
         all_relation_ids = self.get_relationship(Relationships.child)
-        col_anns = self.base_page.get_annotation(annotation_ids=all_relation_ids, category_names=[LayoutType.column])
+        col_anns = self.base_page.get_annotation(annotation_ids=all_relation_ids, category_names=LayoutType.column)
         return col_anns
 
     @property
@@ -311,12 +485,15 @@ class Table(Layout):
             if isinstance(ann, ContainerAnnotation):
                 if isinstance(ann.value, list):
                     html_list = copy(ann.value)
+        # position of the first occurrence of each html token, so that cell ids can be replaced in one pass
+        html_index: Dict[str, int] = {}
+        for idx, token in enumerate(html_list):
+            html_index.setdefault(token, idx)
         for cell in self.cells:
-            try:
-                html_index = html_list.index(cell.annotation_id)
-                html_list.pop(html_index)
-                html_list.insert(html_index, cell.text)  # type: ignore
-            except ValueError:
+            position = html_index.get(cell.annotation_id)
+            if position is not None:
+                html_list[position] = cell.text  # type: ignore
+            else:
                 logger.warning(LoggingRecord("html construction not possible", {"annotation_id": cell.annotation_id}))
 
         return "".join(html_list)
@@ -346,12 +523,11 @@ class Table(Layout):
         out = " ".join([" ".join(row + ["\n"]) for row in self.csv])
         return out
 
-    @property
-    def text(self) -> str:
+    def _collect_text(self) -> str:
         try:
             return str(self)
         except (TypeError, AnnotationError):
-            return super().text
+            return super()._collect_text()
 
     @property
     def text_(self) -> JsonDict:
@@ -383,16 +559,11 @@ class Table(Layout):
             "token_tag_ids": token_tag_ids,
         }
 
-    @property
-    def words(self) -> List[ImageAnnotationBaseView]:
-        """
-        Get a list of `ImageAnnotationBaseView` objects with `LayoutType` defined by `text_container`.
-        It will only select those among all annotations that have an entry in `Relationships.child` .
-        """
+    def _collect_words(self) -> List[ImageAnnotationBaseView]:
         all_words: List[ImageAnnotationBaseView] = []
         cells = self.cells
         if not cells:
-            return super().words
+            return super()._collect_words()
         for cell in cells:
             all_words.extend(cell.words)  # type: ignore
         return all_words
@@ -440,25 +611,22 @@ def ann_obj_view_factory(annotation: ImageAnnotation, text_container: ObjectType
     Create an `ImageAnnotationBaseView` sub class given the mapping `IMAGE_ANNOTATION_TO_LAYOUTS` .
 
     :param annotation: The annotation to transform. Note, that we do not use the input annotation as base class
-                       but create a whole new instance.
+                       but create a whole new instance with `ImageAnnotationBaseView.from_annotation`. The `image` of
+                       the annotation will be shared with the new instance.
     :param text_container: `LayoutType` to create a list of `words` and eventually generate `text`
     :return: Transformed annotation
     """
 
-    # We need to handle annotations that are text containers like words
-    if annotation.category_name == text_container:
-        layout_class = IMAGE_ANNOTATION_TO_LAYOUTS[LayoutType.word]
-    else:
-        layout_class = IMAGE_ANNOTATION_TO_LAYOUTS[annotation.category_name]
-    ann_dict = annotation.as_dict()
-    layout = layout_class.from_dict(**ann_dict)
-    if image_dict := ann_dict.get("image"):
-        layout.image = Page.from_dict(**image_dict)
+    # We need to handle annotations that are text containers like words. `ObjectTypes` members hash like their
+    # string values, hence the lookup is a plain dict lookup and no further caching is required.
+    category_name = annotation.category_name
+    layout_class = IMAGE_ANNOTATION_TO_LAYOUTS[LayoutType.word if category_name == text_container else category_name]
+    layout = layout_class.from_annotation(annotation)
     layout.text_container = text_container
     return layout
 
 
-class Page(Image):
+class Page(_MemoizedAttributes, Image):
     """
     Consumer class for its super `Image` class. It comes with some handy `@property` as well as
     custom `__getattr__` to give easier access to various information that are stored in the base class
@@ -473,6 +641,18 @@ class Page(Image):
     image_orig: Base image
 
     text_container: LayoutType to take the text from
+
+    floating_text_block_categories: Top level layout objects that are returned by `layouts`. The categories are read
+                                    once when `layouts` is called for the first time.
+
+    The layout annotations and the positions of annotations for selecting them by `annotation_id` are computed once and
+    memoized. Dumping or removing annotations resets the memoized values. `layouts` filters the memoized layouts by
+    `active` on every call.
+
+    The views of a page are not deep copies of the annotations of `image_orig`: Bounding boxes and the containers of
+    sub categories and relationships are copied, but the sub category annotations themselves are shared. Modifying a
+    sub category annotation of a view in place, e.g. setting the `value` of a `ContainerAnnotation`, will therefore
+    modify the annotation of `image_orig` as well.
     """
 
     text_container: ObjectTypes
@@ -490,10 +670,39 @@ class Page(Image):
         "page_number",
     }
     include_residual_text_container: bool = True
+    _cached_attributes: Tuple[str, ...] = ("_layouts", "_annotation_positions", "_abs_bbox_table")
+
+    def dump(self, annotation: ImageAnnotation) -> None:
+        super().dump(annotation)
+        self._invalidate_cache()
+        self._increment_cache_revision()
+
+    def remove(self, annotation: ImageAnnotation) -> None:
+        super().remove(annotation)
+        self._invalidate_cache()
+        self._increment_cache_revision()
+
+    def _get_cache_revision(self) -> int:
+        return self.__dict__.get("_cache_revision", 0)
+
+    def _increment_cache_revision(self) -> None:
+        """
+        Mark all values memoized by views of this page, e.g. `Layout.text`, as outdated.
+        """
+        self.__dict__["_cache_revision"] = self._get_cache_revision() + 1
+
+    def _get_annotation_positions(self) -> Dict[str, int]:
+        annotation_positions = self.__dict__.get("_annotation_positions")
+        if annotation_positions is None:
+            annotation_positions = {ann.annotation_id: position for position, ann in enumerate(self.annotations)}
+            self.__dict__["_annotation_positions"] = annotation_positions
+        return annotation_positions
 
     def get_annotation(  # type: ignore
         self,
-        category_names: Optional[Union[str, ObjectTypes, Sequence[Union[str, ObjectTypes]]]] = None,
+        category_names: Optional[
+            Union[str, ObjectTypes, Sequence[Union[str, ObjectTypes]], FrozenSet[ObjectTypes]]
+        ] = None,
         annotation_ids: Optional[Union[str, Sequence[str]]] = None,
         service_id: Optional[Union[str, Sequence[str]]] = None,
         model_id: Optional[Union[str, Sequence[str]]] = None,
@@ -510,7 +719,7 @@ class Page(Image):
         Identical to its base class method for having correct return types. If the base class changes, please
         change this method as well.
 
-        :param category_names: A single name or list of names
+        :param category_names: A single name, a list of names or a frozenset of `ObjectTypes`
         :param annotation_ids: A single id or list of ids
         :param service_id: A single service name or list of service names
         :param model_id: A single model name or list of model names
@@ -520,28 +729,32 @@ class Page(Image):
         :return: A (possibly empty) list of Annotations
         """
 
-        if category_names is not None:
+        if category_names is not None and not isinstance(category_names, frozenset):
             category_names = (
-                [get_type(cat_name) for cat_name in category_names]
+                {get_type(cat_name) for cat_name in category_names}
                 if isinstance(category_names, list)
-                else [get_type(category_names)]  # type:ignore
+                else {get_type(category_names)}  # type:ignore
             )
-        ann_ids = [annotation_ids] if isinstance(annotation_ids, str) else annotation_ids
+        ann_ids = {annotation_ids} if isinstance(annotation_ids, str) else annotation_ids
         service_id = [service_id] if isinstance(service_id, str) else service_id
         model_id = [model_id] if isinstance(model_id, str) else model_id
         session_id = [session_ids] if isinstance(session_ids, str) else session_ids
 
-        if ignore_inactive:
-            anns = filter(lambda x: x.active, self.annotations)
+        if ann_ids is not None:
+            # annotations are looked up by their position instead of scanning the whole page. Sorting the positions
+            # keeps the order of `self.annotations`
+            annotation_positions = self._get_annotation_positions()
+            positions = sorted({annotation_positions[ann_id] for ann_id in ann_ids if ann_id in annotation_positions})
+            anns = [self.annotations[position] for position in positions]
         else:
-            anns = self.annotations  # type:ignore
+            anns = self.annotations
+
+        if ignore_inactive:
+            anns = filter(lambda x: x.active, anns)  # type:ignore
 
         if category_names is not None:
             anns = filter(lambda x: x.category_name in category_names, anns)  # type:ignore
 
-        if ann_ids is not None:
-            anns = filter(lambda x: x.annotation_id in ann_ids, anns)  # type:ignore
-
         if service_id is not None:
             anns = filter(lambda x: x.generating_service in service_id, anns)  # type:ignore
 
@@ -558,12 +771,8 @@ class Page(Image):
             raise ImageError(f"Attribute {item} is not supported for {type(self)}")
         if self.summary is not None:
             if item in self.summary.sub_categories:
-                sub_cat = self.summary.get_sub_category(get_type(item))
-                if item != sub_cat.category_name:
-                    return sub_cat.category_name
-                if isinstance(sub_cat, ContainerAnnotation):
-                    return sub_cat.value
-                return int(sub_cat.category_id)
+                key = get_type(item)
+                return _resolve_sub_category(key, self.summary.get_sub_category(key))
         return None
 
     @property
@@ -571,7 +780,16 @@ class Page(Image):
         """
         A list of a layouts. Layouts are all exactly all floating text block categories
         """
-        return self.get_annotation(category_names=self.floating_text_block_categories)
+        return [layout for layout in self._layouts if layout.active]
+
+    @cached_property
+    def _layouts(self) -> List[ImageAnnotationBaseView]:
+        # Active and inactive layouts, so that deactivating a layout does not require a reset
+        return self.get_annotation(category_names=self._floating_text_block_types, ignore_inactive=False)
+
+    @cached_property
+    def _floating_text_block_types(self) -> FrozenSet[ObjectTypes]:
+        return frozenset(self.floating_text_block_categories)
 
     @property
     def words(self) -> List[ImageAnnotationBaseView]:
@@ -587,6 +805,57 @@ class Page(Image):
         """
         return self.get_annotation(category_names=LayoutType.table)
 
+    def _get_abs_bbox_table(self) -> Dict[str, Tuple[_RawBox, npt.NDArray[np.float64]]]:
+        abs_bbox_table = self.__dict__.get("_abs_bbox_table")
+        if abs_bbox_table is None:
+            abs_bbox_table = self._materialize_absolute_bboxes()
+        return abs_bbox_table
+
+    def _lookup_abs_bbox(self, annotation_id: str, bounding_box: BoundingBox) -> Optional[npt.NDArray[np.float64]]:
+        """
+        Look up the absolute box of an annotation in `_abs_bbox_table`.
+
+        :param annotation_id: The `annotation_id` of the annotation
+        :param bounding_box: The current bounding box of the annotation
+        :return: The row of the table, or `None` if there is no row or if the coordinates of `bounding_box` differ
+                 from the ones the row has been computed from
+        """
+        entry = self._get_abs_bbox_table().get(annotation_id)
+        if entry is not None and entry[0] == _raw_box(bounding_box):
+            return entry[1]
+        return None
+
+    def _materialize_absolute_bboxes(self) -> Dict[str, Tuple[_RawBox, npt.NDArray[np.float64]]]:
+        """
+        Compute the bounding boxes of all annotations in absolute `xyxy` coordinates of this page in one vectorized
+        step and store them in `_abs_bbox_table`. Boxes with relative coordinates are scaled by
+        `[width, height, width, height]`. Annotations without bounding box are skipped.
+
+        :return: A dict with `annotation_id` as key and the raw coordinates the row has been computed from together
+                 with the box as row of one contiguous array as value
+        """
+        ann_ids: List[str] = []
+        raw_boxes: List[_RawBox] = []
+        for ann in self.annotations:
+            try:
+                bounding_box = ann.get_bounding_box(self.image_id)
+            except AnnotationError:
+                continue
+            ann_ids.append(ann.annotation_id)
+            raw_boxes.append(_raw_box(bounding_box))
+
+        abs_bbox_table: Dict[str, Tuple[_RawBox, npt.NDArray[np.float64]]] = {}
+        if raw_boxes:
+            np_raw_boxes = np.array(raw_boxes, dtype=np.float64)
+            np_boxes = np_raw_boxes[:, :4]
+            abs_mask = np_raw_boxes[:, 4].astype(bool)
+            if not abs_mask.all():
+                scale = np.array([self.width, self.height, self.width, self.height], dtype=np.float64)
+                np_boxes = np.where(abs_mask[:, None], np_boxes, np_boxes * scale)
+            abs_bbox_table = dict(zip(ann_ids, zip(raw_boxes, np_boxes)))
+        self.__dict__["_abs_bbox_table"] = abs_bbox_table
+        return abs_bbox_table
+
     @classmethod
     def from_image(
         cls,
@@ -619,47 +888,40 @@ class Page(Image):
         if include_residual_text_container and LayoutType.line not in floating_text_block_categories:  # type: ignore
             floating_text_block_categories.append(LayoutType.line)  # type: ignore
 
-        img_kwargs = image_orig.as_dict()
-        page = cls(
-            img_kwargs.get("file_name"), img_kwargs.get("location"), img_kwargs.get("external_id")  # type: ignore
-        )
+        # Attributes are read from `image_orig` directly. Going through `as_dict`/`from_dict` deep copies every
+        # annotation (and b64-encodes the pixel data of nested images) only to throw the dicts away again.
+        page = cls(image_orig.file_name, image_orig.location, image_orig.external_id)
         page.image_orig = image_orig
         page.page_number = image_orig.page_number
         page.document_id = image_orig.document_id
         if image_orig.image is not None:
             page.image = image_orig.image  # pass image explicitly so
-        page._image_id = img_kwargs.get("_image_id")
-        if page.image is None:
-            if b64_image := img_kwargs.get("_image"):
-                page.image = b64_image
-        if box_kwargs := img_kwargs.get("_bbox"):
-            page._bbox = BoundingBox.from_dict(**box_kwargs)
-        if embeddings := img_kwargs.get("embeddings"):
-            for image_id, box_dict in embeddings.items():
-                page.set_embedding(image_id, BoundingBox.from_dict(**box_dict))
-        for ann_dict in img_kwargs.get("annotations", []):
-            image_ann = ImageAnnotation.from_dict(**ann_dict)
+        page._image_id = image_orig.image_id
+        if image_orig._bbox is not None:  # pylint: disable=W0212
+            page._bbox = copy(image_orig._bbox)  # pylint: disable=W0212
+        for image_id, bounding_box in image_orig.embeddings.items():
+            page.set_embedding(image_id, copy(bounding_box))
+        for image_ann in image_orig.annotations:
             layout_ann = ann_obj_view_factory(image_ann, text_container)
-            if "image" in ann_dict:
-                image_dict = ann_dict["image"]
-                if image_dict:
-                    image = Image.from_dict(**image_dict)
-                    layout_ann.image = cls.from_image(
-                        image, text_container, floating_text_block_categories, base_page=page
-                    )
+            if image_ann.image is not None:
+                layout_ann.image = cls.from_image(
+                    image_ann.image, text_container, floating_text_block_categories, base_page=page
+                )
             layout_ann.base_page = base_page if base_page is not None else page
             page.dump(layout_ann)
-        if summary_dict := img_kwargs.get("_summary"):
-            page.summary = SummaryAnnotation.from_dict(**summary_dict)
+        if image_orig.summary is not None:
+            page.summary = SummaryAnnotation.from_dict(**image_orig.summary.as_dict())
         page.floating_text_block_categories = floating_text_block_categories  # type: ignore
         page.text_container = text_container  # type: ignore
         page.include_residual_text_container = include_residual_text_container
         return page
 
     def _order(self, block: str) -> List[ImageAnnotationBaseView]:
-        blocks_with_order = [layout for layout in getattr(self, block) if layout.reading_order is not None]
-        blocks_with_order.sort(key=lambda x: x.reading_order)
-        return blocks_with_order
+        # reading order is looked up once per block and the sort is on the plain key
+        orders_and_blocks = [(layout.reading_order, layout) for layout in getattr(self, block)]
+        orders_and_blocks = [order_and_block for order_and_block in orders_and_blocks if order_and_block[0] is not None]
+        orders_and_blocks.sort(key=itemgetter(0))
+        return [layout for _, layout in orders_and_blocks]
 
     def _make_text(self, line_break: bool = True) -> str:
         text: str = ""
@@ -781,6 +1043,8 @@ class Page(Image):
         show_token_class: bool = True,
         ignore_default_token_class: bool = False,
         interactive: bool = False,
+        scale: float = 1.0,
+        interpolation: str = "VIZ",
         **debug_kwargs: str,
     ) -> Optional[ImageType]:
         """
@@ -809,11 +1073,14 @@ class Page(Image):
                             can be displayed differently.
         :param ignore_default_token_class: Will ignore displaying word bounding boxes with default or None token class
                                            label
+        :param scale: Factor by which the annotated image will be resized. The image will only be resized if the factor
+                      is different from 1.0. Labels of small boxes might be easier to read with e.g. `scale=1.3`.
+        :param interpolation: Interpolation method for resizing, see `viz_handler.resize` for available methods.
         :return: If `interactive=False` will return a numpy array.
         """
 
         category_names_list: List[Union[str, None]] = []
-        box_stack = []
+        box_anns: List[ImageAnnotationBaseView] = []
         cells_found = False
 
         if self.image is None and interactive:
@@ -824,44 +1091,38 @@ class Page(Image):
         if debug_kwargs:
             anns = self.get_annotation(category_names=list(debug_kwargs.keys()))
             for ann in anns:
-                box_stack.append(ann.bbox)
+                box_anns.append(ann)
                 category_names_list.append(str(getattr(ann, debug_kwargs[ann.category_name])))
 
         if show_layouts and not debug_kwargs:
             for item in self.layouts:
-                box_stack.append(item.bbox)
+                box_anns.append(item)
                 category_names_list.append(item.category_name.value)
 
         if show_tables and not debug_kwargs:
             for table in self.tables:
-                box_stack.append(table.bbox)
+                box_anns.append(table)
                 category_names_list.append(LayoutType.table.value)
                 if show_cells:
                     for cell in table.cells:
-                        if cell.category_name in {
-                            LayoutType.cell,
-                            CellType.projected_row_header,
-                            CellType.spanning,
-                            CellType.row_header,
-                            CellType.column_header,
-                        }:
+                        if cell.category_name in _VIZ_CELL_CATEGORIES:
                             cells_found = True
-                            box_stack.append(cell.bbox)
+                            box_anns.append(cell)
                             category_names_list.append(None)
                 if show_table_structure:
                     rows = table.rows
                     cols = table.columns
                     for row in rows:
-                        box_stack.append(row.bbox)
+                        box_anns.append(row)
                         category_names_list.append(None)
                     for col in cols:
-                        box_stack.append(col.bbox)
+                        box_anns.append(col)
                         category_names_list.append(None)
 
         if show_cells and not cells_found and not debug_kwargs:
             for ann in self.annotations:
                 if isinstance(ann, Cell) and ann.active:
-                    box_stack.append(ann.bbox)
+                    box_anns.append(ann)
                     category_names_list.append(None)
 
         if show_words and not debug_kwargs:
@@ -874,7 +1135,7 @@ class Page(Image):
                 all_words = self.get_annotation(category_names=LayoutType.word)
             if not ignore_default_token_class:
                 for word in all_words:
-                    box_stack.append(word.bbox)
+                    box_anns.append(word)
                     if show_token_class:
                         category_names_list.append(word.token_class.value if word.token_class is not None else None)
                     else:
@@ -882,15 +1143,15 @@ class Page(Image):
             else:
                 for word in all_words:
                     if word.token_class is not None and word.token_class != TokenClasses.other:
-                        box_stack.append(word.bbox)
+                        box_anns.append(word)
                         if show_token_class:
                             category_names_list.append(word.token_class.value if word.token_class is not None else None)
                         else:
                             category_names_list.append(word.token_tag.value if word.token_tag is not None else None)
 
         if self.image is not None:
-            if box_stack:
-                boxes = np.vstack(box_stack)
+            if box_anns:
+                boxes = self._get_abs_boxes(box_anns)
                 if show_words:
                     img = draw_boxes(
                         self.image,
@@ -901,9 +1162,9 @@ class Page(Image):
                     )
                 else:
                     img = draw_boxes(self.image, boxes, category_names_list)
-                scale_fx, scale_fy = 1.3, 1.3
-                scaled_width, scaled_height = int(self.width * scale_fx), int(self.height * scale_fy)
-                img = viz_handler.resize(img, scaled_width, scaled_height, "VIZ")
+                if scale != 1.0:
+                    scaled_width, scaled_height = int(self.width * scale), int(self.height * scale)
+                    img = viz_handler.resize(img, scaled_width, scaled_height, interpolation)
             else:
                 img = self.image
 
@@ -913,6 +1174,25 @@ class Page(Image):
             return img
         return None
 
+    def _get_abs_boxes(self, anns: Sequence[ImageAnnotationBaseView]) -> npt.NDArray[np.float32]:
+        """
+        Stack the bounding boxes of `anns` in absolute `xyxy` coordinates into one preallocated array. Boxes of
+        annotations of this page are copied from the rows of `_abs_bbox_table` as long as their coordinates have not
+        changed, all others are taken from `bbox`.
+
+        :param anns: Annotations to take the bounding boxes from
+        :return: Array of shape (len(anns), 4)
+        """
+        boxes = np.empty((len(anns), 4), dtype=np.float32)
+        for idx, ann in enumerate(anns):
+            abs_box = (
+                self._lookup_abs_bbox(ann.annotation_id, ann.get_bounding_box(self.image_id))
+                if ann.base_page is self
+                else None
+            )
+            boxes[idx] = abs_box if abs_box is not None else ann.bbox
+        return boxes
+
     @classmethod
     def get_attribute_names(cls) -> Set[str]:
         """
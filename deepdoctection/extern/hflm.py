@@ -19,10 +19,12 @@
 Wrapper for the Hugging Face Language Model for sequence and token  classification
 """
 
+import ast
+import os
 from abc import ABC
 from copy import copy
 from pathlib import Path
-from typing import Any, List, Literal, Mapping, Optional, Tuple, Union
+from typing import Any, List, Literal, Mapping, Optional, Sequence, Tuple, Union
 
 from ..utils.detection_types import JsonDict, Requirement
 from ..utils.file_utils import (
@@ -31,6 +33,7 @@ from ..utils.file_utils import (
     pytorch_available,
     transformers_available,
 )
+from ..utils.logger import LoggingRecord, logger
 from ..utils.settings import TypeOrStr
 from .base import LMSequenceClassifier, SequenceClassResult
 from .hflayoutlm import get_tokenizer_from_model_class
@@ -40,14 +43,17 @@ if pytorch_available():
     import torch
     import torch.nn.functional as F
     from torch import Tensor  # pylint: disable=W0611
+    from torch.nn.utils.rnn import pad_sequence
 
 if transformers_available():
-    from transformers import PretrainedConfig, XLMRobertaForSequenceClassification
+    from transformers import BitsAndBytesConfig, PretrainedConfig, XLMRobertaForSequenceClassification
 
 
 def predict_sequence_classes(
-    input_ids: "Tensor", attention_mask: "Tensor", token_type_ids: "Tensor", model: Union[
-        "XLMRobertaForSequenceClassification"]
+    input_ids: "Tensor",
+    attention_mask: "Tensor",
+    token_type_ids: "Tensor",
+    model: Union["XLMRobertaForSequenceClassification"],
 ) -> SequenceClassResult:
     """
     :param input_ids: Token converted to ids to be taken from LayoutLMTokenizer
@@ -57,12 +63,38 @@ def predict_sequence_classes(
     :return: SequenceClassResult
     """
 
-    outputs = model(input_ids=input_ids, attention_mask=attention_mask, token_type_ids=token_type_ids)
+    with torch.inference_mode():
+        outputs = model(input_ids=input_ids, attention_mask=attention_mask, token_type_ids=token_type_ids)
 
-    score = torch.max(F.softmax(outputs.logits)).tolist()
-    sequence_class_predictions = outputs.logits.argmax(-1).squeeze().tolist()
+        # max of the softmax gives the score along with the argmax of the logits in one pass on the device
+        score, sequence_class_prediction = F.softmax(outputs.logits, dim=-1, dtype=torch.float32).max(dim=-1)
 
-    return SequenceClassResult(class_id=sequence_class_predictions, score=float(score))  # type: ignore
+    return SequenceClassResult(class_id=sequence_class_prediction.item(), score=score.item())  # type: ignore
+
+
+def predict_sequence_classes_batch(
+    input_ids: "Tensor",
+    attention_mask: "Tensor",
+    token_type_ids: "Tensor",
+    model: Union["XLMRobertaForSequenceClassification"],
+) -> List[SequenceClassResult]:
+    """
+    Same as `predict_sequence_classes` but for a batch of padded sequences that are classified in one forward pass.
+
+    :param input_ids: Token converted to ids of shape (batch_size, seq_len)
+    :param attention_mask: The associated attention masks of shape (batch_size, seq_len)
+    :param token_type_ids: Torch tensor of token type ids of shape (batch_size, seq_len)
+    :param model: model for sequence classification
+    :return: A SequenceClassResult for every sequence of the batch
+    """
+
+    with torch.inference_mode():
+        outputs = model(input_ids=input_ids, attention_mask=attention_mask, token_type_ids=token_type_ids)
+        score, sequence_class_prediction = F.softmax(outputs.logits, dim=-1, dtype=torch.float32).max(dim=-1)
+        # scores and class ids are moved to the host together
+        scores_and_class_ids = torch.stack((score, sequence_class_prediction.to(score.dtype)), dim=1).tolist()
+
+    return [SequenceClassResult(class_id=int(class_id), score=score) for score, class_id in scores_and_class_ids]
 
 
 class HFLmSequenceClassifierBase(LMSequenceClassifier, ABC):
@@ -79,24 +111,51 @@ class HFLmSequenceClassifierBase(LMSequenceClassifier, ABC):
         categories: Mapping[str, TypeOrStr],
         device: Optional[Literal["cpu", "cuda"]] = None,
         use_xlm_tokenizer: bool = False,
+        quantize: Optional[Literal["dynamic_int8", "bnb_int8", "bf16"]] = None,
     ):
         self.path_config = path_config_json
         self.path_weights = path_weights
         self.categories = copy(categories)  # type: ignore
+        self.quantize = quantize
 
         if device is not None:
             self.device = device
         else:
             self.device = set_torch_auto_device()
-        self.model.to(self.device)
+        device_type = torch.device(self.device).type
+
+        if quantize == "dynamic_int8":
+            if device_type != "cpu":
+                raise ValueError("quantize='dynamic_int8' is only available for inference on cpu")
+            self.model = torch.ao.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+        elif quantize == "bnb_int8":
+            # 8-bit weights are placed on the gpu when loading the model and cannot be moved afterwards
+            if device_type != "cuda":
+                raise ValueError("quantize='bnb_int8' is only available for inference on cuda")
+        else:
+            self.model.to(self.device)
+            if quantize == "bf16":
+                if device_type == "cuda" and torch.cuda.get_device_capability(self.device)[0] >= 8:
+                    self.model.to(dtype=torch.bfloat16)
+                else:
+                    logger.warning(
+                        LoggingRecord(
+                            "quantize='bf16' requires a cuda device with compute capability >= 8. Will use fp32"
+                        )
+                    )
         self.model.config.tokenizer_class = self.get_tokenizer_class_name(use_xlm_tokenizer)
 
+        # Inputs are padded to max_length by default, so the graph can be captured for fixed shapes. Compiling must
+        # come last, as the compiled module no longer carries the class name of the model.
+        if ast.literal_eval(os.environ.get("DD_COMPILE", "False")):
+            self.model = torch.compile(self.model, mode="reduce-overhead", dynamic=False)
+
     @classmethod
     def get_requirements(cls) -> List[Requirement]:
         return [get_pytorch_requirement(), get_transformers_requirement()]
 
     def clone(self) -> "HFLmSequenceClassifierBase":
-        return self.__class__(self.path_config, self.path_weights, self.categories, self.device)
+        return self.__class__(self.path_config, self.path_weights, self.categories, self.device, quantize=self.quantize)
 
     def _validate_encodings(
         self, **encodings: Union[List[List[str]], "torch.Tensor"]
@@ -118,9 +177,6 @@ class HFLmSequenceClassifierBase(LMSequenceClassifier, ABC):
         else:
             raise ValueError(f"token_type_ids must be list but is {type(token_type_ids)}")
 
-        input_ids = input_ids.to(self.device)
-        attention_mask = attention_mask.to(self.device)
-        token_type_ids = token_type_ids.to(self.device)
         return input_ids, attention_mask, token_type_ids
 
     @staticmethod
@@ -186,11 +242,22 @@ class HFLmSequenceClassifier(HFLmSequenceClassifierBase):
         categories: Mapping[str, TypeOrStr],
         device: Optional[Literal["cpu", "cuda"]] = None,
         use_xlm_tokenizer: bool = True,
+        quantize: Optional[Literal["dynamic_int8", "bnb_int8", "bf16"]] = None,
     ):
+        """
+        :param path_config_json: path to .json config file
+        :param path_weights: path to model artifact
+        :param categories: A dict with key (indices) and values (category names) for sequence classification.
+        :param device: "cpu" or "cuda". If not specified will auto select depending on what is available
+        :param use_xlm_tokenizer: True if one uses the XLM tokenizer
+        :param quantize: Optional reduced precision for inference. "dynamic_int8" quantizes the weights of all linear
+                         layers to int8 (cpu only), "bnb_int8" loads 8-bit weights with bitsandbytes (cuda only) and
+                         "bf16" casts the model to bfloat16 (cuda devices with compute capability >= 8 only).
+        """
         self.name = self.get_name(path_weights, "bert-like")
         self.model_id = self.get_model_id()
-        self.model = self.get_wrapped_model(path_config_json, path_weights)
-        super().__init__(path_config_json, path_weights, categories, device, use_xlm_tokenizer)
+        self.model = self.get_wrapped_model(path_config_json, path_weights, quantize == "bnb_int8")
+        super().__init__(path_config_json, path_weights, categories, device, use_xlm_tokenizer, quantize)
 
     def predict(self, **encodings: Union[List[List[str]], "torch.Tensor"]) -> SequenceClassResult:
         input_ids, attention_mask, token_type_ids = self._validate_encodings(**encodings)
@@ -206,16 +273,67 @@ class HFLmSequenceClassifier(HFLmSequenceClassifierBase):
         result.class_name = self.categories[str(result.class_id)]
         return result
 
+    def predict_batch(
+        self, batch_encodings: Sequence[Mapping[str, Union[List[List[str]], "torch.Tensor"]]]
+    ) -> List[SequenceClassResult]:
+        """
+        Classify several sequences with one forward pass instead of calling `predict` for each of them. Every element
+        of `batch_encodings` must be an encoding as passed to `predict` and hold a single sequence. Sequences are
+        padded to the longest one of the batch.
+
+        :param batch_encodings: A sequence of encodings with keys `input_ids`, `attention_mask` and `token_type_ids`
+        :return: A SequenceClassResult for every encoding, in the same order
+        """
+        if not batch_encodings:
+            return []
+
+        padding_values = {
+            "input_ids": self.model.config.pad_token_id or 0,
+            "attention_mask": 0,
+            "token_type_ids": 0,
+        }
+        batch = {}
+        for key, padding_value in padding_values.items():
+            tensors = [encodings.get(key) for encodings in batch_encodings]
+            if not all(isinstance(tensor, torch.Tensor) and tensor.shape[:-1].numel() == 1 for tensor in tensors):
+                raise ValueError(f"{key} must be a torch.Tensor with a single sequence for every encoding")
+            batch[key] = pad_sequence(
+                [tensor.reshape(-1) for tensor in tensors],  # type: ignore
+                batch_first=True,
+                padding_value=padding_value,
+            )
+        input_ids, attention_mask, token_type_ids = self._validate_encodings(**batch)
+
+        results = predict_sequence_classes_batch(
+            input_ids,
+            attention_mask,
+            token_type_ids,
+            self.model,
+        )
+
+        for result in results:
+            result.class_id += 1
+            result.class_name = self.categories[str(result.class_id)]
+        return results
+
     @staticmethod
-    def get_wrapped_model(path_config_json: str, path_weights: str) -> Any:
+    def get_wrapped_model(path_config_json: str, path_weights: str, load_in_8bit: bool = False) -> Any:
         """
         Get the inner (wrapped) model.
 
         :param path_config_json: path to .json config file
         :param path_weights: path to model artifact
+        :param load_in_8bit: Load 8-bit weights with bitsandbytes. Requires a cuda device.
         :return: 'nn.Module'
         """
         config = PretrainedConfig.from_pretrained(pretrained_model_name_or_path=path_config_json)
+        if load_in_8bit:
+            return XLMRobertaForSequenceClassification.from_pretrained(
+                pretrained_model_name_or_path=path_weights,
+                config=config,
+                quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+                device_map="auto",
+            )
         return XLMRobertaForSequenceClassification.from_pretrained(
             pretrained_model_name_or_path=path_weights, config=config
         )
@@ -269,10 +269,14 @@ class OrderGenerator:
         blocks.sort(key=lambda x: x[0])  # type: ignore
         sorted_blocks = []
         max_block_number = max(list(columns_dict.values()))
-        filtered_blocks: Sequence[Tuple[int, str]]
+        # grouping blocks by block number in one pass instead of filtering all blocks for every block number
+        grouped_blocks: Dict[int, List[Tuple[int, str]]] = {}
+        for block in blocks:
+            grouped_blocks.setdefault(block[0], []).append(block)  # type: ignore
         for idx in range(max_block_number + 1):
-            filtered_blocks = list(filter(lambda x: x[0] == idx, blocks))  # type: ignore # pylint: disable=W0640
-            sorted_blocks.extend(self._sort_anns_grouped_by_blocks(filtered_blocks, anns, image_width, image_height))
+            sorted_blocks.extend(
+                self._sort_anns_grouped_by_blocks(grouped_blocks.get(idx, []), anns, image_width, image_height)
+            )
         reading_blocks = [(idx + 1, block[1]) for idx, block in enumerate(sorted_blocks)]
 
         if logger.isEnabledFor(DEBUG):
@@ -314,7 +318,7 @@ class OrderGenerator:
         if not block:
             return []
         anns_and_blocks_numbers = list(zip(*block))
-        ann_ids = anns_and_blocks_numbers[1]
+        ann_ids = set(anns_and_blocks_numbers[1])
         block_number = anns_and_blocks_numbers[0][0]
         block_anns = [ann for ann in anns if ann.annotation_id in ann_ids]
         block_anns.sort(
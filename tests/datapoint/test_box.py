@@ -110,6 +110,27 @@ class TestBoundingBox:
         assert isinstance(box_copy, BoundingBox)
         assert box_copy.absolute_coords is False
 
+    @staticmethod
+    @mark.basic
+    def test_from_dicts(box: Box) -> None:
+        """
+        Testing that from_dicts generates the same boxes as from_dict
+        :param box: Box dataclass from fixtures
+        """
+
+        # Arrange
+        box_dicts = [
+            {"absolute_coords": box.absolute_coords, "ulx": box.ulx, "uly": box.uly, "lrx": box.lrx, "lry": box.lry},
+            {"absolute_coords": box.absolute_coords, "ulx": box.ulx, "uly": box.uly, "height": box.h, "width": box.w},
+        ]
+
+        # Act
+        bounding_boxes = BoundingBox.from_dicts(box_dicts)
+
+        # Assert
+        assert bounding_boxes == [BoundingBox.from_dict(**box_dict) for box_dict in box_dicts]
+        assert BoundingBox.from_dicts([]) == []
+
 
 @mark.basic
 @mark.parametrize(
@@ -19,14 +19,21 @@
 Testing the module datapoint.page
 """
 
+from typing import Tuple
+
 from numpy import float32, ones
 from pytest import mark
 
-from deepdoctection.datapoint.annotation import CategoryAnnotation, ImageAnnotation
+from deepdoctection.datapoint.annotation import (
+    CategoryAnnotation,
+    ContainerAnnotation,
+    ImageAnnotation,
+    SummaryAnnotation,
+)
 from deepdoctection.datapoint.box import BoundingBox
 from deepdoctection.datapoint.image import Image
-from deepdoctection.datapoint.view import Page
-from deepdoctection.utils.settings import LayoutType, Relationships
+from deepdoctection.datapoint.view import Layout, Page
+from deepdoctection.utils.settings import LayoutType, PageType, Relationships, TableType, WordType
 
 from ..test_utils import get_test_path
 from .conftest import WhiteImage
@@ -98,6 +105,31 @@ def test_image_with_anns_can_be_saved(image: WhiteImage) -> None:
         assert False, f"{exception}"
 
 
+@mark.basic
+def test_page_viz_scale(image: WhiteImage) -> None:
+    """
+    test viz only resizes the image if a scale different from 1.0 is passed
+    """
+
+    # Arrange
+    test_image = Image(location=image.loc, file_name=image.file_name)
+    test_image.image = ones((40, 85, 3), dtype=float32)
+    cat_1 = ImageAnnotation(
+        category_name="table",
+        bounding_box=BoundingBox(ulx=15.0, uly=20.0, width=10.0, height=8.0, absolute_coords=True),
+    )
+    test_image.dump(cat_1)
+    page = Page.from_image(test_image, LayoutType.word, [LayoutType.text])
+
+    # Act
+    img = page.viz()
+    scaled_img = page.viz(scale=2.0)
+
+    # Assert
+    assert img.shape == (40, 85, 3)
+    assert scaled_img.shape == (80, 170, 3)
+
+
 @mark.basic
 def test_load_page_from_file() -> None:
     """
@@ -148,3 +180,395 @@ def test_get_layout_context() -> None:
         "41c5cb4b-f7b2-3c7c-93de-b2556d560de9",
         "e8785459-890e-3a97-823b-f07aa5eff5a2",
     ]
+
+
+@mark.basic
+def test_layout_words_and_text_are_memoized(dp_image_with_layout_and_word_annotations: Image) -> None:
+    """
+    test `Layout.words` and `Layout.text` are computed once and are reset when relationships change
+    """
+
+    # Arrange
+    dp_image = dp_image_with_layout_and_word_annotations
+    word_anns = dp_image.get_annotation(category_names="word")
+    for idx, word_ann in enumerate(word_anns):
+        word_ann.dump_sub_category(
+            Relationships.reading_order,
+            CategoryAnnotation(category_name=Relationships.reading_order, category_id=str(idx + 1)),
+        )
+    page = Page.from_image(dp_image, LayoutType.word, [LayoutType.text, LayoutType.title])
+    layout = page.get_annotation(annotation_ids=dp_image.annotations[0].annotation_id)[0]
+    assert isinstance(layout, Layout)
+
+    # Act
+    words = layout.words
+
+    # Assert
+    assert layout.words is words
+    assert layout.text == "hello world"
+
+    # Act
+    layout.dump_relationship(Relationships.child, word_anns[2].annotation_id)
+
+    # Assert
+    assert "_words" not in layout.__dict__
+    assert "_text" not in layout.__dict__
+    assert len(layout.words) == 3
+    assert layout.text == "hello world bye"
+
+
+@mark.basic
+def test_layout_text_is_reset_when_words_change(dp_image_with_layout_and_word_annotations: Image) -> None:
+    """
+    test `Layout.text` and `Layout.words` are re-computed when the reading order of a word is replaced or a word is
+    deactivated
+    """
+
+    # Arrange
+    dp_image = dp_image_with_layout_and_word_annotations
+    word_anns = dp_image.get_annotation(category_names="word")
+    for idx, word_ann in enumerate(word_anns):
+        word_ann.dump_sub_category(
+            Relationships.reading_order,
+            CategoryAnnotation(category_name=Relationships.reading_order, category_id=str(idx + 1)),
+        )
+    page = Page.from_image(dp_image, LayoutType.word, [LayoutType.text, LayoutType.title])
+    layout = page.get_annotation(annotation_ids=dp_image.annotations[0].annotation_id)[0]
+    assert isinstance(layout, Layout)
+    assert layout.text == "hello world"
+    hello, world = page.get_annotation(annotation_ids=[word_anns[0].annotation_id, word_anns[1].annotation_id])
+
+    # Act
+    hello.remove_sub_category(Relationships.reading_order)
+    hello.dump_sub_category(
+        Relationships.reading_order, CategoryAnnotation(category_name=Relationships.reading_order, category_id="3")
+    )
+
+    # Assert
+    assert layout.text == "world hello"
+
+    # Act
+    world.deactivate()
+
+    # Assert
+    assert layout.words == [hello]
+    assert layout.text == "hello"
+
+
+@mark.basic
+@mark.parametrize(
+    "reading_orders,expected_text",
+    [
+        (("3", "1", "2"), "world bye hello"),
+        (("7", "1", "4"), "world bye hello"),
+        (("2", "2", "1"), "bye hello world"),
+    ],
+)
+def test_layout_text_respects_reading_order(
+    dp_image_with_layout_and_word_annotations: Image, reading_orders: Tuple[str, str, str], expected_text: str
+) -> None:
+    """
+    test `Layout.text` for consecutive, sparse and repeated reading orders of words
+    """
+
+    # Arrange
+    dp_image = dp_image_with_layout_and_word_annotations
+    word_anns = dp_image.get_annotation(category_names="word")
+    for word_ann, reading_order in zip(word_anns, reading_orders):
+        word_ann.dump_sub_category(
+            Relationships.reading_order,
+            CategoryAnnotation(category_name=Relationships.reading_order, category_id=reading_order),
+        )
+    dp_image.annotations[0].dump_relationship(Relationships.child, word_anns[2].annotation_id)
+    page = Page.from_image(dp_image, LayoutType.word, [LayoutType.text, LayoutType.title])
+    layout = page.get_annotation(annotation_ids=dp_image.annotations[0].annotation_id)[0]
+
+    # Act
+    text = layout.text
+
+    # Assert
+    assert text == expected_text
+
+
+@mark.basic
+def test_page_layouts_are_memoized(dp_image_with_layout_and_word_annotations: Image) -> None:
+    """
+    test `Page.layouts` is computed once, is reset when annotations are dumped or removed and respects deactivated
+    layouts
+    """
+
+    # Arrange
+    page = Page.from_image(dp_image_with_layout_and_word_annotations, LayoutType.word, [LayoutType.text])
+
+    # Act
+    layouts = page.layouts
+
+    # Assert
+    assert "_layouts" in page.__dict__
+    assert page.layouts == layouts
+    assert len(layouts) == 1
+
+    # Act
+    text_ann = ImageAnnotation(
+        category_name=LayoutType.text,
+        bounding_box=BoundingBox(ulx=1.0, uly=1.0, width=4.0, height=4.0, absolute_coords=True),
+    )
+    page.dump(text_ann)
+
+    # Assert
+    assert "_layouts" not in page.__dict__
+    assert len(page.layouts) == 2
+
+    # Act
+    page.remove(text_ann)
+
+    # Assert
+    assert len(page.layouts) == 1
+
+    # Act
+    page.layouts[0].deactivate()
+
+    # Assert
+    assert page.layouts == []
+    assert page.text == ""
+
+
+@mark.basic
+def test_page_get_annotation_by_annotation_ids(dp_image_with_layout_and_word_annotations: Image) -> None:
+    """
+    test `Page.get_annotation` returns annotations selected by `annotation_ids` in the order of the page and finds
+    annotations dumped after the first selection
+    """
+
+    # Arrange
+    page = Page.from_image(dp_image_with_layout_and_word_annotations, LayoutType.word, [LayoutType.text])
+    ann_ids = [ann.annotation_id for ann in page.annotations]
+
+    # Act
+    anns = page.get_annotation(annotation_ids=ann_ids[::-1] + ["foo"])
+
+    # Assert
+    assert [ann.annotation_id for ann in anns] == ann_ids
+
+    # Act
+    text_ann = ImageAnnotation(
+        category_name=LayoutType.text,
+        bounding_box=BoundingBox(ulx=1.0, uly=1.0, width=4.0, height=4.0, absolute_coords=True),
+    )
+    page.dump(text_ann)
+    anns = page.get_annotation(annotation_ids=text_ann.annotation_id)
+
+    # Assert
+    assert anns == [text_ann]
+
+
+@mark.basic
+def test_sub_category_attributes_are_resolved_once(dp_image_with_layout_and_word_annotations: Image) -> None:
+    """
+    test sub category attributes are served from `_sub_cat_view` and are reset when sub categories change
+    """
+
+    # Arrange
+    dp_image = dp_image_with_layout_and_word_annotations
+    page = Page.from_image(dp_image, LayoutType.word, [LayoutType.text, LayoutType.title])
+    word = page.get_annotation(category_names=LayoutType.word)[0]
+
+    # Act
+    characters = word.characters
+
+    # Assert
+    assert characters == "hello"
+    assert word.__dict__["_sub_cat_view"]["characters"] == "hello"
+    assert word.reading_order is None
+
+    # Act
+    word.dump_sub_category(
+        Relationships.reading_order, CategoryAnnotation(category_name=Relationships.reading_order, category_id="3")
+    )
+
+    # Assert
+    assert word.reading_order == 3
+
+
+@mark.basic
+def test_summary_attributes_follow_summary_changes(dp_image_with_layout_and_word_annotations: Image) -> None:
+    """
+    test summary sub category attributes of `Page` and of views are resolved from the current summary
+    """
+
+    # Arrange
+    dp_image = dp_image_with_layout_and_word_annotations
+    page = Page.from_image(dp_image, LayoutType.word, [LayoutType.text, LayoutType.title])
+    page.summary = SummaryAnnotation()
+    word = page.get_annotation(category_names=LayoutType.word)[0]
+    assert page.language is None
+    assert word.characters == "hello"
+
+    # Act
+    page.summary.dump_sub_category(PageType.language, ContainerAnnotation(category_name=PageType.language, value="eng"))
+    word_image = Image(location=dp_image.location, file_name=dp_image.file_name)
+    word_image.summary = SummaryAnnotation()
+    word_image.summary.dump_sub_category(
+        PageType.language, ContainerAnnotation(category_name=PageType.language, value="deu")
+    )
+    word.image = word_image
+
+    # Assert
+    assert page.language == "eng"
+    assert word.language == "deu"
+
+
+@mark.basic
+def test_bbox_with_relative_and_absolute_coords(image: WhiteImage) -> None:
+    """
+    test `bbox` returns absolute coordinates for annotations with relative and absolute bounding boxes
+    """
+
+    # Arrange
+    test_image = Image(location=image.loc, file_name=image.file_name)
+    test_image.image = ones((20, 40, 3), dtype=float32)
+    test_image.dump(
+        ImageAnnotation(
+            category_name="text",
+            bounding_box=BoundingBox(ulx=0.25, uly=0.5, lrx=0.5, lry=1.0, absolute_coords=False),
+        )
+    )
+    test_image.dump(
+        ImageAnnotation(
+            category_name="title",
+            bounding_box=BoundingBox(ulx=15.0, uly=2.0, width=10.0, height=8.0, absolute_coords=True),
+        )
+    )
+
+    # Act
+    page = Page.from_image(test_image, LayoutType.word, [LayoutType.text, LayoutType.title])
+    text = page.get_annotation(category_names=LayoutType.text)[0]
+    title = page.get_annotation(category_names=LayoutType.title)[0]
+
+    # Assert
+    assert text.bbox == [10.0, 10.0, 20.0, 20.0]
+    assert title.bbox == [15.0, 2.0, 25.0, 10.0]
+
+
+@mark.basic
+def test_bbox_is_not_stale_after_box_replacement_and_dump(image: WhiteImage) -> None:
+    """
+    test `bbox` returns the coordinates of a replaced or modified bounding box and the absolute box table is reset on
+    `dump`
+    """
+
+    # Arrange
+    test_image = Image(location=image.loc, file_name=image.file_name)
+    test_image.image = ones((60, 60, 3), dtype=float32)
+    test_image.dump(
+        ImageAnnotation(
+            category_name="text",
+            bounding_box=BoundingBox(ulx=1.0, uly=1.0, lrx=10.0, lry=10.0, absolute_coords=True),
+        )
+    )
+    page = Page.from_image(test_image, LayoutType.word, [LayoutType.text, LayoutType.title])
+    text = page.get_annotation(category_names=LayoutType.text)[0]
+    assert text.bbox == [1.0, 1.0, 10.0, 10.0]
+
+    # Act
+    text.bounding_box = BoundingBox(ulx=20.0, uly=20.0, lrx=50.0, lry=50.0, absolute_coords=True)
+
+    # Assert
+    assert text.bbox == [20.0, 20.0, 50.0, 50.0]
+    assert page._get_abs_boxes([text]).tolist() == [[20.0, 20.0, 50.0, 50.0]]  # pylint: disable=W0212
+
+    # Act
+    text.bounding_box.ulx = 5.0
+    text.bounding_box.lrx = 40.0
+
+    # Assert
+    assert text.bbox == [5.0, 20.0, 40.0, 50.0]
+    assert page._get_abs_boxes([text]).tolist() == [[5.0, 20.0, 40.0, 50.0]]  # pylint: disable=W0212
+
+    # Act
+    page.dump(
+        ImageAnnotation(
+            category_name="title",
+            bounding_box=BoundingBox(ulx=0.0, uly=0.0, lrx=5.0, lry=5.0, absolute_coords=True),
+        )
+    )
+
+    # Assert
+    assert "_abs_bbox_table" not in page.__dict__
+
+
+@mark.basic
+def test_view_from_annotation(dp_image_with_layout_and_word_annotations: Image) -> None:
+    """
+    test `from_annotation` copies the annotation without sharing sub category and relationship containers and the
+    bounding box
+    """
+
+    # Arrange
+    ann = dp_image_with_layout_and_word_annotations.get_annotation(category_names=LayoutType.title)[0]
+
+    # Act
+    layout = Layout.from_annotation(ann)
+    layout.dump_relationship(Relationships.child, "bd2e3ee6-cc0c-3c8c-a9f7-6ec3b47f4d5a")
+
+    # Assert
+    assert isinstance(layout, Layout)
+    assert layout.annotation_id == ann.annotation_id
+    assert layout.category_name == LayoutType.title
+    assert layout.bounding_box == ann.bounding_box
+    assert layout.sub_categories == ann.sub_categories
+    assert len(layout.get_relationship(Relationships.child)) == len(ann.get_relationship(Relationships.child)) + 1
+
+    # Act
+    assert layout.bounding_box is not None
+    layout.bounding_box.ulx = 999.0
+
+    # Assert
+    assert ann.bounding_box is not None
+    assert ann.bounding_box.ulx != 999.0
+
+
+@mark.basic
+def test_table_html(image: WhiteImage) -> None:
+    """
+    test `Table.html` replaces cell ids in the html sub category with the cell text
+    """
+
+    # Arrange
+    test_image = Image(location=image.loc, file_name=image.file_name)
+    test_image.image = ones((40, 40, 3), dtype=float32)
+    table = ImageAnnotation(
+        category_name=LayoutType.table,
+        bounding_box=BoundingBox(ulx=1.0, uly=1.0, lrx=30.0, lry=30.0, absolute_coords=True),
+    )
+    test_image.dump(table)
+    html = ["<table>", "<tr>"]
+    for idx, characters in enumerate(["foo", "bak"]):
+        cell = ImageAnnotation(
+            category_name=LayoutType.cell,
+            bounding_box=BoundingBox(ulx=2.0 + 10 * idx, uly=2.0, lrx=10.0 + 10 * idx, lry=10.0, absolute_coords=True),
+        )
+        word = ImageAnnotation(
+            category_name=LayoutType.word,
+            bounding_box=BoundingBox(ulx=3.0 + 10 * idx, uly=3.0, lrx=9.0 + 10 * idx, lry=9.0, absolute_coords=True),
+        )
+        test_image.dump(cell)
+        test_image.dump(word)
+        word.dump_sub_category(
+            WordType.characters, ContainerAnnotation(category_name=WordType.characters, value=characters)
+        )
+        word.dump_sub_category(
+            Relationships.reading_order,
+            CategoryAnnotation(category_name=Relationships.reading_order, category_id=str(idx + 1)),
+        )
+        cell.dump_relationship(Relationships.child, word.annotation_id)
+        table.dump_relationship(Relationships.child, cell.annotation_id)
+        html.extend(["<td>", cell.annotation_id, "</td>"])
+    html.extend(["</tr>", "</table>"])
+    table.dump_sub_category(TableType.html, ContainerAnnotation(category_name=TableType.html, value=html))
+
+    # Act
+    page = Page.from_image(test_image, LayoutType.word, [LayoutType.table])
+
+    # Assert
+    assert page.tables[0].html == "<table><tr><td>foo</td><td>bak</td></tr></table>"
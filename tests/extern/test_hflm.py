@@ -19,15 +19,17 @@
 """
 Testing module extern.hflayoutlm
 """
+import os
+from typing import Optional
 from unittest.mock import MagicMock, patch
 
-from pytest import mark
+from pytest import approx, mark, raises
 
 from deepdoctection.extern.base import SequenceClassResult
-from deepdoctection.extern.hflm import HFLmSequenceClassifier
+from deepdoctection.extern.hflm import HFLmSequenceClassifier, predict_sequence_classes_batch
 from deepdoctection.utils.detection_types import JsonDict
 from deepdoctection.utils.file_utils import pytorch_available
-from deepdoctection.utils.settings import  get_type
+from deepdoctection.utils.settings import get_type
 
 from ..mapper.data import DatapointXfund
 from ..test_utils import get_mock_patch
@@ -79,3 +81,210 @@ class TestHFLmSequenceClassifier:
 
         # Assert
         assert results.class_name == "BAK"
+
+    @staticmethod
+    @mark.pt_deps
+    @patch.object(HFLmSequenceClassifier, "get_tokenizer_class_name", MagicMock(return_value="XLMRobertaTokenizerFast"))
+    @patch("deepdoctection.extern.hflm.predict_sequence_classes_batch")
+    def test_hf_lm_predict_batch_pads_sequences(mock_predict_batch: MagicMock) -> None:
+        """
+        HFLmSequenceClassifier.predict_batch pads sequences of different length and post processes every
+        SequenceClassResult correctly
+        """
+
+        # Arrange
+        HFLmSequenceClassifier.get_wrapped_model = MagicMock(  # type: ignore
+            return_value=get_mock_patch("XLMRobertaForSequenceClassification")
+        )
+        categories = {"1": get_type("FOO"), "2": get_type("BAK")}
+        classifier = HFLmSequenceClassifier("path/to/json", "path/to/model", categories, device="cpu")
+        classifier.model.config.pad_token_id = 1
+        mock_predict_batch.return_value = [
+            SequenceClassResult(class_id=1, score=0.9),
+            SequenceClassResult(class_id=0, score=0.8),
+        ]
+        short_inputs = {
+            "input_ids": torch.tensor([[0, 5, 2]]),
+            "attention_mask": torch.tensor([[1, 1, 1]]),
+            "token_type_ids": torch.tensor([[0, 0, 0]]),
+        }
+        long_inputs = {
+            "input_ids": torch.tensor([[0, 5, 6, 7, 2]]),
+            "attention_mask": torch.tensor([[1, 1, 1, 1, 1]]),
+            "token_type_ids": torch.tensor([[0, 0, 0, 0, 0]]),
+        }
+
+        # Act
+        results = classifier.predict_batch([short_inputs, long_inputs])
+
+        # Assert
+        input_ids, attention_mask, token_type_ids, _ = mock_predict_batch.call_args.args
+        assert input_ids.tolist() == [[0, 5, 2, 1, 1], [0, 5, 6, 7, 2]]
+        assert attention_mask.tolist() == [[1, 1, 1, 0, 0], [1, 1, 1, 1, 1]]
+        assert token_type_ids.tolist() == [[0, 0, 0, 0, 0], [0, 0, 0, 0, 0]]
+        assert [result.class_id for result in results] == [2, 1]
+        assert [result.class_name for result in results] == [get_type("BAK"), get_type("FOO")]
+
+    @staticmethod
+    @mark.pt_deps
+    @patch.object(HFLmSequenceClassifier, "get_tokenizer_class_name", MagicMock(return_value="XLMRobertaTokenizerFast"))
+    def test_hf_lm_predict_batch_raises_for_several_sequences_in_one_encoding() -> None:
+        """
+        HFLmSequenceClassifier.predict_batch raises a ValueError if one encoding holds more than one sequence
+        """
+
+        # Arrange
+        HFLmSequenceClassifier.get_wrapped_model = MagicMock(  # type: ignore
+            return_value=get_mock_patch("XLMRobertaForSequenceClassification")
+        )
+        categories = {"1": get_type("FOO"), "2": get_type("BAK")}
+        classifier = HFLmSequenceClassifier("path/to/json", "path/to/model", categories, device="cpu")
+        inputs = {
+            "input_ids": torch.tensor([[0, 5, 2], [0, 6, 2]]),
+            "attention_mask": torch.tensor([[1, 1, 1], [1, 1, 1]]),
+            "token_type_ids": torch.tensor([[0, 0, 0], [0, 0, 0]]),
+        }
+
+        # Act and Assert
+        with raises(ValueError):
+            classifier.predict_batch([inputs])
+
+    @staticmethod
+    @mark.pt_deps
+    @mark.parametrize("device,quantize", [("cuda", "dynamic_int8"), ("cpu", "bnb_int8")])
+    @patch.object(HFLmSequenceClassifier, "get_tokenizer_class_name", MagicMock(return_value="XLMRobertaTokenizerFast"))
+    def test_hf_lm_quantize_raises_for_unsupported_device(device: str, quantize: str) -> None:
+        """
+        HFLmSequenceClassifier raises a ValueError if the quantization is not available for the device
+        """
+
+        # Arrange
+        HFLmSequenceClassifier.get_wrapped_model = MagicMock(  # type: ignore
+            return_value=get_mock_patch("XLMRobertaForSequenceClassification")
+        )
+        categories = {"1": get_type("FOO"), "2": get_type("BAK")}
+
+        # Act and Assert
+        with raises(ValueError):
+            HFLmSequenceClassifier(
+                "path/to/json", "path/to/model", categories, device=device, quantize=quantize  # type: ignore
+            )
+
+    @staticmethod
+    @mark.pt_deps
+    @patch.object(HFLmSequenceClassifier, "get_tokenizer_class_name", MagicMock(return_value="XLMRobertaTokenizerFast"))
+    @patch("deepdoctection.extern.hflm.torch.ao.quantization.quantize_dynamic")
+    def test_hf_lm_quantize_dynamic_int8_on_cpu(mock_quantize_dynamic: MagicMock) -> None:
+        """
+        HFLmSequenceClassifier quantizes the linear layers of the model dynamically with quantize="dynamic_int8"
+        """
+
+        # Arrange
+        model = get_mock_patch("XLMRobertaForSequenceClassification")
+        HFLmSequenceClassifier.get_wrapped_model = MagicMock(return_value=model)  # type: ignore
+        categories = {"1": get_type("FOO"), "2": get_type("BAK")}
+
+        # Act
+        classifier = HFLmSequenceClassifier(
+            "path/to/json", "path/to/model", categories, device="cpu", quantize="dynamic_int8"
+        )
+
+        # Assert
+        mock_quantize_dynamic.assert_called_once_with(model, {torch.nn.Linear}, dtype=torch.qint8)
+        assert classifier.model is mock_quantize_dynamic.return_value
+
+    @staticmethod
+    @mark.pt_deps
+    @patch.object(HFLmSequenceClassifier, "get_tokenizer_class_name", MagicMock(return_value="XLMRobertaTokenizerFast"))
+    @patch("deepdoctection.extern.hflm.logger")
+    def test_hf_lm_quantize_bf16_falls_back_to_fp32_on_cpu(mock_logger: MagicMock) -> None:
+        """
+        HFLmSequenceClassifier warns and keeps fp32 weights with quantize="bf16" on a device without bf16 support
+        """
+
+        # Arrange
+        model = get_mock_patch("XLMRobertaForSequenceClassification")
+        HFLmSequenceClassifier.get_wrapped_model = MagicMock(return_value=model)  # type: ignore
+        categories = {"1": get_type("FOO"), "2": get_type("BAK")}
+
+        # Act
+        HFLmSequenceClassifier("path/to/json", "path/to/model", categories, device="cpu", quantize="bf16")
+
+        # Assert
+        mock_logger.warning.assert_called_once()
+        model.to.assert_called_once_with("cpu")
+
+    @staticmethod
+    @mark.pt_deps
+    @patch.object(HFLmSequenceClassifier, "get_tokenizer_class_name", MagicMock(return_value="XLMRobertaTokenizerFast"))
+    def test_hf_lm_clone_passes_quantize() -> None:
+        """
+        HFLmSequenceClassifier.clone creates a classifier with the same quantization
+        """
+
+        # Arrange
+        HFLmSequenceClassifier.get_wrapped_model = MagicMock(  # type: ignore
+            return_value=get_mock_patch("XLMRobertaForSequenceClassification")
+        )
+        categories = {"1": get_type("FOO"), "2": get_type("BAK")}
+        classifier = HFLmSequenceClassifier(
+            "path/to/json", "path/to/model", categories, device="cuda", quantize="bnb_int8"
+        )
+
+        # Act
+        cloned_classifier = classifier.clone()
+
+        # Assert
+        assert cloned_classifier.quantize == "bnb_int8"
+        HFLmSequenceClassifier.get_wrapped_model.assert_called_with("path/to/json", "path/to/model", True)
+
+    @staticmethod
+    @mark.pt_deps
+    @mark.parametrize("dd_compile,compiled", [("True", True), ("False", False), (None, False)])
+    @patch.object(HFLmSequenceClassifier, "get_tokenizer_class_name", MagicMock(return_value="XLMRobertaTokenizerFast"))
+    @patch("deepdoctection.extern.hflm.torch.compile")
+    def test_hf_lm_compiles_model_with_dd_compile(
+        mock_compile: MagicMock, dd_compile: Optional[str], compiled: bool
+    ) -> None:
+        """
+        HFLmSequenceClassifier compiles the model with torch.compile only if DD_COMPILE is set to a truthy value
+        """
+
+        # Arrange
+        model = get_mock_patch("XLMRobertaForSequenceClassification")
+        HFLmSequenceClassifier.get_wrapped_model = MagicMock(return_value=model)  # type: ignore
+        categories = {"1": get_type("FOO"), "2": get_type("BAK")}
+        environ = {"DD_COMPILE": dd_compile} if dd_compile is not None else {}
+
+        # Act
+        with patch.dict(os.environ, environ):
+            if dd_compile is None:
+                os.environ.pop("DD_COMPILE", None)
+            classifier = HFLmSequenceClassifier("path/to/json", "path/to/model", categories, device="cpu")
+
+        # Assert
+        if compiled:
+            mock_compile.assert_called_once_with(model, mode="reduce-overhead", dynamic=False)
+            assert classifier.model is mock_compile.return_value
+        else:
+            mock_compile.assert_not_called()
+            assert classifier.model is model
+
+
+@mark.pt_deps
+def test_predict_sequence_classes_batch_maps_scores_and_class_ids() -> None:
+    """
+    predict_sequence_classes_batch returns one SequenceClassResult per sequence with the arg max class and its score
+    """
+
+    # Arrange
+    model = MagicMock(return_value=MagicMock(logits=torch.tensor([[0.0, 2.0], [3.0, 0.0]])))
+    input_ids = torch.tensor([[0, 5, 2], [0, 6, 2]])
+
+    # Act
+    results = predict_sequence_classes_batch(input_ids, torch.ones_like(input_ids), torch.zeros_like(input_ids), model)
+
+    # Assert
+    assert [result.class_id for result in results] == [1, 0]
+    assert results[0].score == approx(torch.softmax(torch.tensor([0.0, 2.0]), dim=-1)[1].item())
+    assert results[1].score == approx(torch.softmax(torch.tensor([3.0, 0.0]), dim=-1)[0].item())